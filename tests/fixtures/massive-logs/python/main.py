@@ -1,41 +1,54 @@
 #!/usr/bin/env python3
 """Generate 10,000 structured log entries."""
 
-import json
 import random
+import sys
 from datetime import datetime, timedelta
+from itertools import cycle
 
 LOG_COUNT = 10000
 
-LEVELS = ['DEBUG', 'INFO', 'WARN', 'ERROR']
-COMPONENTS = ['auth', 'api', 'db', 'cache', 'queue', 'worker']
-ACTIONS = ['request', 'response', 'query', 'insert', 'update', 'delete', 'connect', 'disconnect']
+LEVELS = ('DEBUG', 'INFO', 'WARN', 'ERROR')
+COMPONENTS = ('auth', 'api', 'db', 'cache', 'queue', 'worker')
+ACTIONS = ('request', 'response', 'query', 'insert', 'update', 'delete', 'connect', 'disconnect')
 
+# Timestamps are 1ms apart from a single start time. Only the whole-second
+# part needs datetime arithmetic, so those prefixes are formatted up front.
+BASE_TIME = datetime.now()
+BASE_MICROS = BASE_TIME.microsecond
+SECOND_PREFIXES = [
+    (BASE_TIME.replace(microsecond=0) + timedelta(seconds=second)).isoformat()
+    for second in range((BASE_MICROS + LOG_COUNT * 1000) // 1_000_000 + 1)
+]
 
-def generate_log(index: int) -> dict:
-    level = LEVELS[index % len(LEVELS)]
-    component = COMPONENTS[index % len(COMPONENTS)]
-    action = ACTIONS[index % len(ACTIONS)]
-    timestamp = (datetime.now() + timedelta(milliseconds=index)).isoformat()
+# Random durations in [0, 1000], drawn in one batch up front
+DURATIONS = random.choices(range(1001), k=LOG_COUNT)
 
-    return {
-        'index': index,
-        'timestamp': timestamp,
-        'level': level,
-        'component': component,
-        'action': action,
-        'message': f'{action} operation on {component}',
-        'metadata': {
-            'requestId': f'req-{index:08x}',
-            'duration': random.randint(0, 1000),
-            'success': index % 10 != 0
-        }
-    }
+
+def generate_log(index: int, level: str, component: str, action: str) -> str:
+    """Serialize one log entry as a JSON line.
+
+    The schema is fixed and every value is JSON-safe, so the line is built
+    directly instead of going through json.dumps (same output, same key order).
+    """
+    second, micros = divmod(BASE_MICROS + index * 1000, 1_000_000)
+    timestamp = f'{SECOND_PREFIXES[second]}.{micros:06d}'
+    request_id = index.to_bytes(4, 'big').hex()  # same as f'{index:08x}'
+    duration = DURATIONS[index]
+    success = 'false' if index % 10 == 0 else 'true'
+
+    return (
+        f'{{"index": {index}, "timestamp": "{timestamp}", "level": "{level}", '
+        f'"component": "{component}", "action": "{action}", '
+        f'"message": "{action} operation on {component}", '
+        f'"metadata": {{"requestId": "req-{request_id}", "duration": {duration}, '
+        f'"success": {success}}}}}\n'
+    )
 
 
 # Generate all logs (no breakpoint - runs directly)
-for i in range(LOG_COUNT):
-    log = generate_log(i)
-    print(json.dumps(log))
+# Levels, components and actions rotate with the index
+for i, level, component, action in zip(range(LOG_COUNT), cycle(LEVELS), cycle(COMPONENTS), cycle(ACTIONS)):
+    sys.stdout.write(generate_log(i, level, component, action))
 
 print('Done generating logs')
@@ -1,6 +1,7 @@
 # Performance test fixture: 1000 logs immediately, then 1 log every 100ms
 # Used for testing tree toggle performance with streaming output
 
+import sys
 import time
 
 INITIAL_COUNT = 1000
@@ -9,19 +10,29 @@ INTERVAL_S = 0.1
 log_index = 0
 
 
-def emit_log():
+def emit_log(timestamp):
     global log_index
-    print(f"[{log_index}] Log message at {time.time()}")
+    # One write per line: print() issues the text and the newline separately
+    sys.stdout.write(f"[{log_index}] Log message at {timestamp}\n")
     log_index += 1
 
 
-# Emit 1000 logs immediately
-for _ in range(INITIAL_COUNT):
-    emit_log()
+def emit_burst(count, timestamp):
+    # Same lines as emit_log, but counting in a local and updating the global once
+    global log_index
+    write = sys.stdout.write
+    suffix = f" Log message at {timestamp}\n"
+    for index in range(log_index, log_index + count):
+        write(f"[{index}]{suffix}")
+    log_index += count
+
+
+# Emit 1000 logs immediately (they all share the burst's timestamp)
+emit_burst(INITIAL_COUNT, time.time())
 
 print("--- Initial logs done, starting streaming ---")
 
 # Then emit one log every 100ms (indefinitely until killed)
 while True:
     time.sleep(INTERVAL_S)
-    emit_log()
+    emit_log(time.time())